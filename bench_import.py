@@ -0,0 +1,83 @@
+# Benchmark do tempo de importação de pop_sim_core.
+#
+# Garante que o núcleo headless continue importando apenas NumPy:
+#   1. nenhum pacote de terceiros além do NumPy pode aparecer em sys.modules
+#      depois do import (só a biblioteca padrão é permitida);
+#   2. o custo do próprio import de pop_sim_core, medido com o NumPy já
+#      carregado, deve ficar abaixo de um limite (em ms).
+#
+# Uso:
+#     python bench_import.py            # limite padrão
+#     python bench_import.py 10         # limite de 10 ms
+# Pode ser chamado de qualquer diretório. Sai com código 1 em caso de regressão.
+
+import os
+import statistics
+import subprocess
+import sys
+
+MODULE = "pop_sim_core"
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+ALLOWED = ["numpy", MODULE]
+REPEATS = 10
+MAX_IMPORT_MS = 5.0
+
+# cada medição roda num interpretador novo, como um worker em batch;
+# o NumPy é importado antes para que só o custo do módulo entre na conta
+TIMER = """
+import sys, time
+import numpy
+before = set(sys.modules)
+t0 = time.perf_counter()
+import {module}
+t1 = time.perf_counter()
+new = {{m.partition(".")[0] for m in set(sys.modules) - before}}
+extra = sorted(new - set(sys.stdlib_module_names) - set({allowed!r}))
+print((t1 - t0) * 1000)
+print(",".join(extra))
+"""
+
+
+def measure(module):
+    """Retorna (tempo em ms, pacotes de terceiros carregados) de um import a frio."""
+    code = TIMER.format(module=module, allowed=ALLOWED)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, cwd=MODULE_DIR)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    out = result.stdout.splitlines()
+    loaded = set(out[1].split(",")) if len(out) > 1 and out[1] else set()
+    return float(out[0]), loaded
+
+
+def median_ms(module):
+    """Mediana do tempo de import e união dos pacotes extras de todas as rodadas."""
+    times = []
+    loaded = set()
+    for _ in range(REPEATS):
+        ms, run_loaded = measure(module)
+        times.append(ms)
+        loaded |= run_loaded
+    return statistics.median(times), loaded
+
+
+if __name__ == "__main__":
+    max_import = float(sys.argv[1]) if len(sys.argv) > 1 else MAX_IMPORT_MS
+
+    try:
+        core_ms, loaded = median_ms(MODULE)
+    except RuntimeError as exc:
+        print(f"ERRO: falha ao importar {MODULE}:\n{exc}")
+        sys.exit(1)
+
+    print(f"import {MODULE} (com numpy já carregado): {core_ms:8.2f} ms")
+
+    failed = False
+    if loaded:
+        print(f"ERRO: {MODULE} carregou pacotes além do NumPy: {', '.join(sorted(loaded))}")
+        failed = True
+    if core_ms > max_import:
+        print(f"ERRO: import levou {core_ms:.2f} ms > limite {max_import:.2f} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
@@ -2,7 +2,6 @@ import random
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from IPython.display import HTML
 
 
 # -------------------------------
@@ -114,4 +113,5 @@ plt.show()
 # -------------------------------
 anim.save("simulacao_populacao_v01.mp4", writer="ffmpeg", fps=16)
 
+# from IPython.display import HTML
 # HTML(anim.to_jshtml())
\ No newline at end of file
@@ -0,0 +1,238 @@
+# Núcleo de cálculo (headless) das simulações populacionais.
+#
+# Este módulo importa apenas NumPy. Matplotlib, Mesa e SimPy são carregados
+# sob demanda, dentro das funções que realmente precisam deles, para que
+# jobs em lote que só calculam números não paguem o custo dessas importações.
+#
+# Uso típico em batch:
+#     from pop_sim_core import simulate_fixed_birth, running_mean
+#     hist = simulate_fixed_birth(p_death=0.1, timesteps=180, seed=42)
+#     media = running_mean(hist, start=20)
+
+import numpy as np
+
+# -------------------------------
+# Parâmetros padrão (mesmos dos scripts)
+# -------------------------------
+P_DEATH = 0.1
+P_BIRTH = 1.0
+TIMESTEPS = 180
+MOVE_SCALE = 0.02
+MAX_ENTITIES = 20
+FADE_SPEED = 0.1
+START_MEAN = 20
+
+
+# -------------------------------
+# Modelo 1: nascimento fixo (pop-sim-v01 / v02)
+# -------------------------------
+def simulate_fixed_birth(p_death=P_DEATH, timesteps=TIMESTEPS, seed=None):
+    """Nasce 1 entidade por step; cada viva morre com prob. p_death.
+
+    As mortes de um step são sorteadas de uma vez com uma binomial,
+    equivalente a sortear cada entidade individualmente.
+    """
+    rng = np.random.default_rng(seed)
+    pop_history = np.empty(timesteps, dtype=np.int64)
+    N = 0
+    for t in range(timesteps):
+        # 1. nascimento
+        N += 1
+        # 2. mortes
+        N = rng.binomial(N, 1.0 - p_death)
+        pop_history[t] = N
+    return pop_history
+
+
+# -------------------------------
+# Modelo 2: nascimento probabilístico com limite (animation-comparacao, Modelo 2)
+# -------------------------------
+def simulate_probabilistic_birth(p_death=P_DEATH, p_birth=P_BIRTH,
+                                 timesteps=TIMESTEPS, max_entities=MAX_ENTITIES,
+                                 seed=None):
+    """Nasce no máximo 1 entidade por step (se abaixo do limite); cada viva
+    morre com prob. p_death. Retorna o histórico de entidades vivas."""
+    rng = np.random.default_rng(seed)
+    pop_history = np.empty(timesteps, dtype=np.int64)
+    N = 0
+    for t in range(timesteps):
+        # nascimento
+        if rng.random() < p_birth and N < max_entities:
+            N += 1
+        # mortes
+        N = rng.binomial(N, 1.0 - p_death)
+        pop_history[t] = N
+    return pop_history
+
+
+# -------------------------------
+# Estatísticas
+# -------------------------------
+def running_mean(pop_history, start=0):
+    """Média acumulada a partir do step `start` (NaN antes dele)."""
+    pop = np.asarray(pop_history, dtype=float)
+    mean_values = np.full(pop.shape, np.nan)
+    sub_pop = pop[start:]
+    mean_values[start:] = np.cumsum(sub_pop) / np.arange(1, len(sub_pop) + 1)
+    return mean_values
+
+
+# -------------------------------
+# Visualização (matplotlib carregado só aqui)
+# -------------------------------
+def plot_history(pop_history, start_mean=START_MEAN, title=None, show=True):
+    """Plota a população viva e sua média acumulada."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.plot(pop_history, color="tab:red", label="População viva")
+    ax.plot(running_mean(pop_history, start_mean), color="tab:gray",
+            linestyle="--", label="Média")
+    ax.set_xlabel("Tempo (step)")
+    ax.set_ylabel("Número de entidades vivas")
+    if title:
+        ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+    if show:
+        plt.show()
+    return fig
+
+
+# -------------------------------
+# Integração com Mesa (carregado só aqui)
+# -------------------------------
+_mesa_model_class = None
+
+
+def _get_mesa_model_class():
+    """Cria (uma única vez) a classe do modelo Mesa, importando Mesa sob demanda."""
+    global _mesa_model_class
+    if _mesa_model_class is not None:
+        return _mesa_model_class
+
+    from mesa import Agent, Model
+    from mesa.datacollection import DataCollector
+
+    class Entity(Agent):
+        """Uma entidade que se move, pode morrer e fazer fade-out"""
+
+        def __init__(self, model, pos):
+            super().__init__(model)
+            self.pos = pos
+            self.alive = True
+            self.alpha = 1.0
+
+        def step(self):
+            if self.alive:
+                if self.model.random.random() < self.model.p_death:
+                    self.alive = False
+                else:
+                    x, y = self.pos
+                    dx = self.model.random.uniform(-self.model.move_scale, self.model.move_scale)
+                    dy = self.model.random.uniform(-self.model.move_scale, self.model.move_scale)
+                    self.pos = (np.clip(x + dx, 0, 1), np.clip(y + dy, 0, 1))
+            else:
+                self.alpha -= self.model.fade_speed
+
+    class PopulationModel(Model):
+        """Modelo de população com nascimento, morte e movimento"""
+
+        def __init__(self, p_death=P_DEATH, p_birth=P_BIRTH, move_scale=MOVE_SCALE,
+                     max_entities=MAX_ENTITIES, fade_speed=FADE_SPEED, seed=None):
+            # gerador próprio do modelo (self.random), sem mexer no `random` global
+            super().__init__(seed=seed)
+            self.p_death = p_death
+            self.p_birth = p_birth
+            self.move_scale = move_scale
+            self.max_entities = max_entities
+            self.fade_speed = fade_speed
+            self.entities = []
+            self.datacollector = DataCollector(
+                model_reporters={
+                    "Alive": lambda m: sum(1 for a in m.entities if a.alive),
+                    "Total": lambda m: len(m.entities)
+                }
+            )
+
+        def step(self):
+            alive_count = sum(1 for a in self.entities if a.alive)
+            if self.random.random() < self.p_birth and alive_count < self.max_entities:
+                self.entities.append(Entity(self, (self.random.random(), self.random.random())))
+
+            entities_shuffled = self.entities.copy()
+            self.random.shuffle(entities_shuffled)
+            for entity in entities_shuffled:
+                entity.step()
+
+            self.entities = [a for a in self.entities if a.alpha > 0]
+            self.datacollector.collect(self)
+
+    _mesa_model_class = PopulationModel
+    return _mesa_model_class
+
+
+def simulate_mesa(timesteps=TIMESTEPS, seed=None, **params):
+    """Roda o modelo Mesa e retorna o histórico de entidades vivas."""
+    model = _get_mesa_model_class()(seed=seed, **params)
+    for _ in range(timesteps):
+        model.step()
+    df = model.datacollector.get_model_vars_dataframe()
+    return np.asarray(df["Alive"].tolist(), dtype=np.int64)
+
+
+# -------------------------------
+# Integração com SimPy (carregado só aqui)
+# -------------------------------
+def simulate_simpy(p_death=P_DEATH, p_birth=P_BIRTH, move_scale=MOVE_SCALE,
+                   timesteps=TIMESTEPS, max_entities=MAX_ENTITIES, seed=None):
+    """Roda a versão SimPy (pop-sim-simpy) e retorna o histórico de vivos."""
+    import random
+    import simpy
+
+    # gerador local: não altera o estado do `random` global do processo
+    rng = random.Random(seed)
+    population = []
+    pop_history = []
+
+    def entity_life(env, entity_id):
+        entity = {"id": entity_id, "x": rng.random(), "y": rng.random(), "alive": True}
+        population.append(entity)
+        while entity["alive"]:
+            if rng.random() < p_death:
+                entity["alive"] = False
+            else:
+                entity["x"] = np.clip(entity["x"] + rng.uniform(-move_scale, move_scale), 0, 1)
+                entity["y"] = np.clip(entity["y"] + rng.uniform(-move_scale, move_scale), 0, 1)
+            yield env.timeout(1)
+
+    def birth_process(env):
+        entity_id = 0
+        while True:
+            if rng.random() < p_birth and len(population) < max_entities:
+                env.process(entity_life(env, entity_id))
+                entity_id += 1
+            yield env.timeout(1)
+
+    def data_collector(env):
+        while True:
+            pop_history.append(sum(e["alive"] for e in population))
+            yield env.timeout(1)
+
+    env = simpy.Environment()
+    env.process(birth_process(env))
+    env.process(data_collector(env))
+    env.run(until=timesteps)
+    return np.asarray(pop_history, dtype=np.int64)
+
+
+# -------------------------------
+# Execução direta: batch headless, sem gráficos
+# -------------------------------
+if __name__ == "__main__":
+    hist_1 = simulate_fixed_birth(seed=42)
+    hist_2 = simulate_probabilistic_birth(seed=42)
+    print(f"Modelo 1 - média (a partir do step {START_MEAN}): "
+          f"{running_mean(hist_1, START_MEAN)[-1]:.2f}")
+    print(f"Modelo 2 - média (a partir do step {START_MEAN}): "
+          f"{running_mean(hist_2, START_MEAN)[-1]:.2f}")